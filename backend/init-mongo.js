@@ -2,13 +2,14 @@ const db = db.getSiblingDB("framework_hub")
 
 // Create collections
 db.createCollection("build_logs")
-db.createCollection("generated_code")
+db.createCollection("generated_code", { capped: true, size: 1048576, max: 10 })
 
 // Create indexes
 db.build_logs.createIndex({ build_id: 1 }, { unique: true })
 db.build_logs.createIndex({ start_time: -1 })
-db.build_logs.createIndex({ type: 1 })
-db.build_logs.createIndex({ status: 1 })
+db.build_logs.createIndex({ type: 1, status: 1, start_time: -1 })
+db.build_logs.createIndex({ type: 1, start_time: -1 })
+db.build_logs.createIndex({ status: 1, start_time: -1 })
 
 db.generated_code.createIndex({ created_at: -1 })
 db.generated_code.createIndex({ language: 1 })
@@ -17,7 +17,8 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
         logging.FileHandler('jenkins.log'),
-        logging.StreamHandler(sys.stdout)
+        # stdout is reserved for JSON results read by main.py
+        logging.StreamHandler(sys.stderr)
     ]
 )
 
@@ -178,14 +179,41 @@ class JenkinsJobTrigger:
                 "error": str(e)
             }
 
+def run_worker():
+    """
+    Worker mode: read one build data JSON object per stdin line and
+    write one JSON result per stdout line until stdin is closed
+    """
+    jenkins_trigger = JenkinsJobTrigger()
+    
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        
+        try:
+            build_data = json.loads(line)
+            result = jenkins_trigger.trigger_job(build_data)
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON data: {str(e)}")
+            result = {"success": False, "error": "Invalid JSON data"}
+        except Exception as e:
+            logger.error(f"Unexpected error: {str(e)}")
+            result = {"success": False, "error": str(e)}
+        
+        print(json.dumps(result), flush=True)
+
 def main():
     """
     Main function to handle command line execution
     """
     if len(sys.argv) < 2:
-        print("Usage: python jenkins.py <build_data_json>")
+        print("Usage: python jenkins.py <build_data_json> | --worker")
         sys.exit(1)
     
+    if sys.argv[1] == "--worker":
+        run_worker()
+        return
+    
     try:
         # Parse build data from command line argument
         build_data_json = sys.argv[1]
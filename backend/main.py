@@ -1,45 +1,139 @@
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from motor.motor_asyncio import AsyncIOMotorClient
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError, CollectionInvalid, PyMongoError
 import os
-import json
+import orjson
 import subprocess
 import asyncio
+import logging
+import time
 from contextlib import asynccontextmanager
 
 # Database connection
 MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
 DATABASE_NAME = "framework_hub"
+GENERATED_CODE_LIMIT = 10
+FINISHED_BUILD_STATUSES = ("completed", "failed")
+GENERATED_CODE_CACHE_TTL = 60  # seconds
+JENKINS_WORKER_TIMEOUT = 30  # seconds
+JENKINS_WORKER_READ_LIMIT = 16 * 1024 * 1024  # Longest result line accepted from the worker
+
+logger = logging.getLogger(__name__)
 
 # Global database client
 db_client: AsyncIOMotorClient = None
 database = None
+# False when generated_code could not be capped and inserts must trim it themselves
+generated_code_capped = False
+
+# Serialized generated code responses: code_id -> (expires_at, body).
+# Per process, so invalidation only reaches the process that handled the write.
+generated_code_cache: Dict[str, Tuple[float, bytes]] = {}
+
+# Long-lived jenkins.py worker, one JSON request/response line at a time
+jenkins_worker: Optional[asyncio.subprocess.Process] = None
+jenkins_worker_lock = asyncio.Lock()
+
+async def start_jenkins_worker() -> asyncio.subprocess.Process:
+    """Start jenkins.py in worker mode with stdin/stdout pipes"""
+    return await asyncio.create_subprocess_exec(
+        "python3", "jenkins.py", "--worker",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        limit=JENKINS_WORKER_READ_LIMIT
+    )
+
+async def ensure_generated_code_capped(database) -> bool:
+    """Make generated_code a capped collection, converting an existing uncapped one in place"""
+    try:
+        await database.create_collection(
+            "generated_code", capped=True, size=1 << 20, max=GENERATED_CODE_LIMIT
+        )
+        return True
+    except CollectionInvalid:
+        pass  # Already exists
+    
+    options = await database.generated_code.options()
+    try:
+        if not options.get("capped"):
+            await database.command("convertToCapped", "generated_code", size=1 << 20)
+        # convertToCapped can't set a document limit; collMod can since MongoDB 6.0
+        if options.get("max") != GENERATED_CODE_LIMIT:
+            await database.command("collMod", "generated_code", cappedMax=GENERATED_CODE_LIMIT)
+    except PyMongoError as e:
+        logger.warning(f"Could not cap generated_code: {str(e)}")
+    
+    # Re-read rather than trust the commands above, another process may have raced us
+    options = await database.generated_code.options()
+    if options.get("capped") and options.get("max") == GENERATED_CODE_LIMIT:
+        return True
+    logger.warning("generated_code is not capped, trimming on insert instead")
+    return False
+
+async def exchange_with_jenkins_worker(worker: asyncio.subprocess.Process, build_data_json: str) -> bytes:
+    """Write one request line to the worker and read its result line"""
+    worker.stdin.write(build_data_json.encode() + b"\n")
+    await worker.stdin.drain()
+    return await worker.stdout.readline()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    global db_client, database
-    db_client = AsyncIOMotorClient(MONGODB_URL)
+    global db_client, database, jenkins_worker, generated_code_capped
+    db_client = AsyncIOMotorClient(
+        MONGODB_URL,
+        maxPoolSize=50,
+        minPoolSize=10,  # Keep warm connections ready
+        compressors="zstd,zlib",
+        retryWrites=True,
+        serverSelectionTimeoutMS=3000,
+        waitQueueTimeoutMS=2000
+    )
     database = db_client[DATABASE_NAME]
     
+    # Capped collection keeps only the most recent generated code entries
+    generated_code_capped = await ensure_generated_code_capped(database)
+    
     # Create indexes
     await database.build_logs.create_index("build_id", unique=True)
+    # Serve every get_build_logs filter combination and its start_time sort from an index
+    await database.build_logs.create_index([("type", 1), ("status", 1), ("start_time", -1)])
+    await database.build_logs.create_index([("type", 1), ("start_time", -1)])
+    await database.build_logs.create_index([("status", 1), ("start_time", -1)])
+    await database.build_logs.create_index([("start_time", -1)])
     await database.generated_code.create_index("created_at")
     
+    # Pay the interpreter startup cost once instead of per trigger
+    jenkins_worker = await start_jenkins_worker()
+    
     yield
     
     # Shutdown
+    if jenkins_worker and jenkins_worker.returncode is None:
+        jenkins_worker.stdin.close()
+        await jenkins_worker.wait()
     db_client.close()
 
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson; unknown types such as ObjectId fall back to str"""
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+
 app = FastAPI(
     title="Framework Hub API",
     description="Backend API for Framework Hub platform",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -75,8 +169,7 @@ class BuildLogResponse(BaseModel):
     jenkins_job: str
     output_log: Optional[str] = None
     
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, extra="ignore", defer_build=False)
 
 class GeneratedCode(BaseModel):
     language: str
@@ -93,8 +186,7 @@ class GeneratedCodeResponse(BaseModel):
     description: str
     created_at: datetime
     
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, extra="ignore", defer_build=False)
 
 class UpdateBuildStatus(BaseModel):
     status: str
@@ -116,16 +208,9 @@ async def get_database():
 async def trigger_jenkins_job(job_request: JenkinsJobRequest):
     """Trigger a Jenkins job via jenkins.py script"""
     try:
-        # Prepare data for jenkins.py script
-        build_data = {
-            "build_id": job_request.build_id,
-            "job_type": job_request.job_type,
-            "config": job_request.config,
-            "command": job_request.command
-        }
-        
-        # Convert to JSON string for command line argument
-        build_data_json = json.dumps(build_data)
+        # Serialize the request straight to the JSON argument expected by jenkins.py
+        # (build_id, job_type, config, command)
+        build_data_json = job_request.model_dump_json()
         
         # Execute jenkins.py script
         result = await execute_jenkins_script(build_data_json)
@@ -141,28 +226,39 @@ async def trigger_jenkins_job(job_request: JenkinsJobRequest):
         raise HTTPException(status_code=500, detail=f"Failed to trigger Jenkins job: {str(e)}")
 
 async def execute_jenkins_script(build_data_json: str) -> dict:
-    """Execute the jenkins.py script asynchronously"""
+    """Send build data to the jenkins.py worker and wait for its result"""
+    global jenkins_worker
     try:
-        # Run jenkins.py script with build data
-        process = await asyncio.create_subprocess_exec(
-            "python3", "jenkins.py", build_data_json,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=os.path.dirname(os.path.abspath(__file__))
-        )
-        
-        stdout, stderr = await process.communicate()
+        # The worker answers requests in order, so only one may be in flight
+        async with jenkins_worker_lock:
+            if jenkins_worker is None or jenkins_worker.returncode is not None:
+                jenkins_worker = await start_jenkins_worker()
+            
+            try:
+                line = await asyncio.wait_for(
+                    exchange_with_jenkins_worker(jenkins_worker, build_data_json),
+                    timeout=JENKINS_WORKER_TIMEOUT
+                )
+                if not line:
+                    raise Exception("Jenkins worker exited unexpectedly")
+            except BaseException:
+                # The pipe may hold a half-written request or an unread reply,
+                # so never reuse it; the next call starts a fresh worker
+                if jenkins_worker.returncode is None:
+                    jenkins_worker.kill()
+                jenkins_worker = None
+                raise
         
-        if process.returncode == 0:
-            # Parse JSON output from jenkins.py
-            result = json.loads(stdout.decode())
-            return result
-        else:
-            error_msg = stderr.decode() if stderr else "Unknown error"
-            raise Exception(f"Jenkins script failed: {error_msg}")
+        # Parse JSON output from jenkins.py (orjson accepts the raw bytes)
+        result = orjson.loads(line)
+        if not result.get("success", False):
+            raise Exception(f"Jenkins script failed: {result.get('error', 'Unknown error')}")
+        return result
             
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise Exception(f"Failed to parse Jenkins script output: {str(e)}")
+    except asyncio.TimeoutError:
+        raise Exception(f"Jenkins worker did not respond within {JENKINS_WORKER_TIMEOUT}s")
     except Exception as e:
         raise Exception(f"Failed to execute Jenkins script: {str(e)}")
 
@@ -171,69 +267,143 @@ async def execute_jenkins_script(build_data_json: str) -> dict:
 async def create_build_log(build_log: BuildLog, db=Depends(get_database)):
     """Create a new build log entry"""
     try:
-        build_log_dict = build_log.model_dump()
+        # Don't store optional fields the client never sent (end_time, command, output_log)
+        build_log_dict = build_log.model_dump(mode="python", exclude_unset=True)
         result = await db.build_logs.insert_one(build_log_dict)
         return {"id": str(result.inserted_id), "message": "Build log created successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create build log: {str(e)}")
 
+@app.post("/api/build-logs/bulk", response_model=List[str])
+async def create_build_logs_bulk(build_logs: List[BuildLog], db=Depends(get_database)):
+    """Create several build log entries in a single insert"""
+    try:
+        if not build_logs:
+            raise HTTPException(status_code=400, detail="No build logs provided")
+        
+        build_log_dicts = [log.model_dump(mode="python", exclude_unset=True) for log in build_logs]
+        result = await db.build_logs.insert_many(build_log_dicts, ordered=False)
+        return ORJSONResponse([str(inserted_id) for inserted_id in result.inserted_ids])
+    except HTTPException:
+        raise
+    except BulkWriteError as e:
+        # Unordered inserts keep going past failures (e.g. a duplicate build_id),
+        # so report what was committed alongside what was rejected
+        write_errors = e.details.get("writeErrors", [])
+        failed_indices = {error["index"] for error in write_errors}
+        return ORJSONResponse(
+            status_code=409,
+            content={
+                "detail": f"Failed to create {len(failed_indices)} of {len(build_log_dicts)} build logs",
+                # insert_many sets _id on every document it sends
+                "inserted_ids": [
+                    str(log["_id"]) for index, log in enumerate(build_log_dicts) if index not in failed_indices
+                ],
+                "failed": [
+                    {"index": error["index"], "code": error["code"], "build_id": build_log_dicts[error["index"]]["build_id"]}
+                    for error in write_errors
+                ]
+            }
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to create build logs: {str(e)}")
+
 @app.get("/api/build-logs", response_model=List[BuildLogResponse])
 async def get_build_logs(
     skip: int = 0, 
     limit: int = 100, 
     status: Optional[str] = None,
     type: Optional[str] = None,
+    fields: Optional[str] = Query(
+        None, description="Comma-separated fields to return per log, e.g. build_id,status"
+    ),
     db=Depends(get_database)
 ):
-    """Get build logs with optional filtering"""
+    """Get build logs with optional filtering (output_log is not included)"""
     try:
         query = {}
         if status:
             query["status"] = status
         if type:
             query["type"] = type
+        
+        if fields:
+            selected = [field.strip() for field in fields.split(",") if field.strip()]
+            unknown = [field for field in selected if field not in BuildLog.model_fields]
+            if unknown:
+                raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+            projection = {field: 1 for field in selected}
+        else:
+            projection = {"output_log": 0}
             
-        cursor = db.build_logs.find(query).sort("start_time", -1).skip(skip).limit(limit)
-        build_logs = []
+        build_logs = await db.build_logs.find(query, projection=projection).sort("start_time", -1).skip(skip).limit(limit).to_list(length=None)
         
-        async for log in cursor:
+        for log in build_logs:
             log["_id"] = str(log["_id"])
-            build_logs.append(BuildLogResponse(**log))
-            
-        return build_logs
+        
+        # Return raw documents directly so FastAPI skips jsonable_encoder
+        return ORJSONResponse(build_logs)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch build logs: {str(e)}")
 
 @app.get("/api/build-logs/{build_id}", response_model=BuildLogResponse)
-async def get_build_log(build_id: str, db=Depends(get_database)):
-    """Get a specific build log by build_id"""
+async def get_build_log(build_id: str, include_log: bool = False, db=Depends(get_database)):
+    """Get a specific build log by build_id (output_log only when include_log is set)"""
     try:
-        log = await db.build_logs.find_one({"build_id": build_id})
+        # Leave the potentially large console output in the database unless asked for
+        projection = None if include_log else {"output_log": 0}
+        log = await db.build_logs.find_one({"build_id": build_id}, projection=projection)
         if not log:
             raise HTTPException(status_code=404, detail="Build log not found")
         
         log["_id"] = str(log["_id"])
-        return BuildLogResponse(**log)
+        # Data comes from our own collection, so skip re-validation on the way out.
+        # A log that wasn't requested is left out rather than sent as null,
+        # which would read as a build without output
+        exclude = None if include_log else {"output_log"}
+        return ORJSONResponse(BuildLogResponse.model_construct(**log).model_dump(by_alias=True, exclude=exclude))
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch build log: {str(e)}")
 
-@app.put("/api/build-logs/{build_id}", response_model=dict)
+@app.get("/api/build-logs/{build_id}/log")
+async def get_build_log_output(build_id: str, db=Depends(get_database)):
+    """Get the output log of a build as plain text"""
+    try:
+        log = await db.build_logs.find_one({"build_id": build_id}, projection={"output_log": 1})
+        if not log:
+            raise HTTPException(status_code=404, detail="Build log not found")
+        
+        # Sent as-is, without a JSON envelope around the (possibly large) text
+        return Response(log.get("output_log") or "", media_type="text/plain")
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to fetch build log output: {str(e)}")
+
+@app.put("/api/build-logs/{build_id}", response_model=BuildLogResponse)
 async def update_build_log(build_id: str, update_data: UpdateBuildStatus, db=Depends(get_database)):
-    """Update build log status and other fields"""
+    """Update build log status and other fields, returning the updated log"""
     try:
-        update_dict = {k: v for k, v in update_data.model_dump().items() if v is not None}
+        update_dict = update_data.model_dump(exclude_none=True, exclude_unset=True)
         
-        result = await db.build_logs.update_one(
+        # Update and read back the fresh document in one round trip
+        # output_log is left out so a log upload isn't echoed back to the client
+        updated = await db.build_logs.find_one_and_update(
             {"build_id": build_id},
-            {"$set": update_dict}
+            {"$set": update_dict},
+            projection={"output_log": 0},
+            return_document=ReturnDocument.AFTER
         )
         
-        if result.matched_count == 0:
+        if updated is None:
             raise HTTPException(status_code=404, detail="Build log not found")
             
-        return {"message": "Build log updated successfully"}
+        updated["_id"] = str(updated["_id"])
+        return ORJSONResponse(BuildLogResponse.model_construct(**updated).model_dump(by_alias=True, exclude={"output_log"}))
     except HTTPException:
         raise
     except Exception as e:
@@ -262,21 +432,85 @@ async def clear_all_build_logs(db=Depends(get_database)):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to clear build logs: {str(e)}")
 
+@app.websocket("/ws/build-logs/{build_id}")
+async def watch_build_log(websocket: WebSocket, build_id: str, db=Depends(get_database)):
+    """Push the build log to the client on every change until the build finishes"""
+    await websocket.accept()
+    try:
+        # Deletes carry no fullDocument, so they are matched on _id below
+        pipeline = [{"$match": {"$or": [
+            {"operationType": {"$in": ["update", "replace"]}, "fullDocument.build_id": build_id},
+            {"operationType": "delete"}
+        ]}}]
+        # Open the stream before reading the current state so no change falls in between
+        async with db.build_logs.watch(pipeline, full_document="updateLookup") as stream:
+            log = await db.build_logs.find_one({"build_id": build_id})
+            if not log:
+                await websocket.close(code=4404, reason="Build log not found")
+                return
+            
+            # Current state first, then one message per change instead of client polling
+            await websocket.send_text(orjson.dumps(log, default=str).decode())
+            if log["status"] in FINISHED_BUILD_STATUSES:
+                await websocket.close()
+                return
+            
+            async def push_changes():
+                async for change in stream:
+                    if change["operationType"] == "delete":
+                        if change["documentKey"]["_id"] != log["_id"]:
+                            continue
+                        updated = None
+                    else:
+                        # None when the document was deleted before the lookup ran
+                        updated = change.get("fullDocument")
+                    
+                    if updated is None:
+                        await websocket.close(code=4404, reason="Build log deleted")
+                        return
+                    
+                    await websocket.send_text(orjson.dumps(updated, default=str).decode())
+                    if updated["status"] in FINISHED_BUILD_STATUSES:
+                        await websocket.close()
+                        return
+            
+            async def wait_for_disconnect():
+                while (await websocket.receive())["type"] != "websocket.disconnect":
+                    pass
+            
+            # Stop watching as soon as either the build finishes or the client goes away
+            tasks = [asyncio.create_task(push_changes()), asyncio.create_task(wait_for_disconnect())]
+            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            for task in done:
+                task.result()
+    except WebSocketDisconnect:
+        pass
+    except PyMongoError as e:
+        # Change streams need a replica set; standalone servers reject watch()
+        await websocket.close(code=1011, reason=f"Failed to watch build log: {str(e)}"[:120])
+
 # Generated Code endpoints
 @app.post("/api/generated-code", response_model=dict)
 async def create_generated_code(code: GeneratedCode, db=Depends(get_database)):
     """Create a new generated code entry"""
     try:
-        # Check if we have more than 10 entries, remove oldest if needed
-        count = await db.generated_code.count_documents({})
-        if count >= 10:
-            # Remove oldest entries to keep only 9, so we can add 1 more
-            oldest_entries = await db.generated_code.find().sort("created_at", 1).limit(count - 9).to_list(length=None)
-            oldest_ids = [entry["_id"] for entry in oldest_entries]
-            await db.generated_code.delete_many({"_id": {"$in": oldest_ids}})
+        # A capped generated_code evicts the oldest entry itself
+        if not generated_code_capped:
+            # Check if we have more than 10 entries, remove oldest if needed
+            count = await db.generated_code.estimated_document_count()
+            if count >= GENERATED_CODE_LIMIT:
+                # Remove oldest entries to keep only 9, so we can add 1 more
+                oldest_entries = await db.generated_code.find().sort("created_at", 1).limit(count - GENERATED_CODE_LIMIT + 1).to_list(length=None)
+                oldest_ids = [entry["_id"] for entry in oldest_entries]
+                await db.generated_code.delete_many({"_id": {"$in": oldest_ids}})
         
         code_dict = code.model_dump()
         result = await db.generated_code.insert_one(code_dict)
+        # The insert may have evicted a cached entry
+        generated_code_cache.clear()
         return {"id": str(result.inserted_id), "message": "Generated code saved successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to save generated code: {str(e)}")
@@ -285,14 +519,12 @@ async def create_generated_code(code: GeneratedCode, db=Depends(get_database)):
 async def get_generated_code(skip: int = 0, limit: int = 10, db=Depends(get_database)):
     """Get generated code entries (limited to 10 most recent)"""
     try:
-        cursor = db.generated_code.find().sort("created_at", -1).skip(skip).limit(limit)
-        code_entries = []
+        code_entries = await db.generated_code.find().sort("created_at", -1).skip(skip).limit(limit).to_list(length=None)
         
-        async for entry in cursor:
+        for entry in code_entries:
             entry["_id"] = str(entry["_id"])
-            code_entries.append(GeneratedCodeResponse(**entry))
-            
-        return code_entries
+        
+        return ORJSONResponse(code_entries)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch generated code: {str(e)}")
 
@@ -300,15 +532,30 @@ async def get_generated_code(skip: int = 0, limit: int = 10, db=Depends(get_data
 async def get_generated_code_by_id(code_id: str, db=Depends(get_database)):
     """Get a specific generated code entry by ID"""
     try:
-        if not ObjectId.is_valid(code_id):
+        cache_headers = {"Cache-Control": f"max-age={GENERATED_CODE_CACHE_TTL}"}
+        now = time.monotonic()
+        cached = generated_code_cache.get(code_id)
+        if cached and cached[0] > now:
+            return Response(cached[1], media_type="application/json", headers=cache_headers)
+        
+        try:
+            oid = ObjectId(code_id)
+        except (InvalidId, TypeError):
             raise HTTPException(status_code=400, detail="Invalid code ID format")
             
-        entry = await db.generated_code.find_one({"_id": ObjectId(code_id)})
+        entry = await db.generated_code.find_one({"_id": oid})
         if not entry:
             raise HTTPException(status_code=404, detail="Generated code not found")
         
         entry["_id"] = str(entry["_id"])
-        return GeneratedCodeResponse(**entry)
+        body = orjson.dumps(GeneratedCodeResponse.model_construct(**entry).model_dump(by_alias=True))
+        
+        # Drop expired entries so the cache doesn't outgrow the collection
+        for key in [key for key, (expires_at, _) in generated_code_cache.items() if expires_at <= now]:
+            del generated_code_cache[key]
+        generated_code_cache[code_id] = (now + GENERATED_CODE_CACHE_TTL, body)
+        
+        return Response(body, media_type="application/json", headers=cache_headers)
     except HTTPException:
         raise
     except Exception as e:
@@ -318,10 +565,13 @@ async def get_generated_code_by_id(code_id: str, db=Depends(get_database)):
 async def delete_generated_code(code_id: str, db=Depends(get_database)):
     """Delete a specific generated code entry"""
     try:
-        if not ObjectId.is_valid(code_id):
+        try:
+            oid = ObjectId(code_id)
+        except (InvalidId, TypeError):
             raise HTTPException(status_code=400, detail="Invalid code ID format")
             
-        result = await db.generated_code.delete_one({"_id": ObjectId(code_id)})
+        result = await db.generated_code.delete_one({"_id": oid})
+        generated_code_cache.pop(code_id, None)
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Generated code not found")
             
@@ -336,6 +586,7 @@ async def clear_all_generated_code(db=Depends(get_database)):
     """Clear all generated code entries"""
     try:
         result = await db.generated_code.delete_many({})
+        generated_code_cache.clear()
         return {"message": f"Deleted {result.deleted_count} generated code entries"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to clear generated code: {str(e)}")
@@ -345,35 +596,40 @@ async def clear_all_generated_code(db=Depends(get_database)):
 async def get_stats(db=Depends(get_database)):
     """Get platform statistics"""
     try:
-        # Build logs stats
-        total_builds = await db.build_logs.count_documents({})
-        running_builds = await db.build_logs.count_documents({"status": "running"})
-        completed_builds = await db.build_logs.count_documents({"status": "completed"})
-        failed_builds = await db.build_logs.count_documents({"status": "failed"})
-        
-        # Generated code stats
-        total_generated_code = await db.generated_code.count_documents({})
+        # Build logs stats: every bucket computed in a single pass over the collection
+        pipeline = [
+            {"$facet": {
+                "by_status": [{"$group": {"_id": "$status", "n": {"$sum": 1}}}],
+                "by_type": [{"$group": {"_id": "$type", "n": {"$sum": 1}}}]
+            }}
+        ]
         
-        # Build types stats
-        jtaf_builds = await db.build_logs.count_documents({"type": "JTAF Framework"})
-        floating_builds = await db.build_logs.count_documents({"type": "Floating Framework"})
-        os_builds = await db.build_logs.count_documents({"type": "OS Making"})
+        # Totals come from collection metadata instead of a scan
+        build_stats, total_builds, total_generated_code = await asyncio.gather(
+            db.build_logs.aggregate(pipeline).to_list(length=1),
+            db.build_logs.estimated_document_count(),
+            # Generated code stats
+            db.generated_code.estimated_document_count()
+        )
+        facets = build_stats[0]
+        by_status = {bucket["_id"]: bucket["n"] for bucket in facets["by_status"]}
+        by_type = {bucket["_id"]: bucket["n"] for bucket in facets["by_type"]}
         
         return {
             "build_logs": {
                 "total": total_builds,
-                "running": running_builds,
-                "completed": completed_builds,
-                "failed": failed_builds,
+                "running": by_status.get("running", 0),
+                "completed": by_status.get("completed", 0),
+                "failed": by_status.get("failed", 0),
                 "by_type": {
-                    "jtaf": jtaf_builds,
-                    "floating": floating_builds,
-                    "os_making": os_builds
+                    "jtaf": by_type.get("JTAF Framework", 0),
+                    "floating": by_type.get("Floating Framework", 0),
+                    "os_making": by_type.get("OS Making", 0)
                 }
             },
             "generated_code": {
                 "total": total_generated_code,
-                "limit": 10
+                "limit": GENERATED_CODE_LIMIT
             }
         }
     except Exception as e:
@@ -383,8 +639,11 @@ async def get_stats(db=Depends(get_database)):
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "timestamp": datetime.utcnow()}
+    # Polled before every frontend API call, so skip FastAPI's response encoding
+    return ORJSONResponse({"status": "healthy", "timestamp": datetime.utcnow()})
 
 if __name__ == "__main__":
     import uvicorn
+    # Single process: the jenkins.py worker and generated code cache live in-process.
+    # uvicorn[standard] already picks uvloop and httptools.
     uvicorn.run(app, host="0.0.0.0", port=8000)
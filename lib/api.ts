@@ -109,16 +109,22 @@ export const buildLogsApi = {
       end_time?: string
       output_log?: string
     },
-  ): Promise<{ message: string }> {
+  ): Promise<BuildLogResponse> {
     const isApiAvailable = await checkApiHealth()
     if (!isApiAvailable) {
       const pipelines = JSON.parse(localStorage.getItem("pipelines") || "[]")
       const pipelineIndex = pipelines.findIndex((p: any) => p.id === buildId || p.build_id === buildId)
-      if (pipelineIndex !== -1) {
-        pipelines[pipelineIndex] = { ...pipelines[pipelineIndex], ...data }
-        localStorage.setItem("pipelines", JSON.stringify(pipelines))
+      if (pipelineIndex === -1) throw new Error("Build log not found")
+
+      const pipeline = { ...pipelines[pipelineIndex], ...data }
+      pipelines[pipelineIndex] = pipeline
+      localStorage.setItem("pipelines", JSON.stringify(pipelines))
+      return {
+        ...pipeline,
+        start_time: pipeline.startTime || pipeline.start_time,
+        end_time: pipeline.endTime || pipeline.end_time,
+        jenkins_job: pipeline.jenkinsJob || pipeline.jenkins_job,
       }
-      return { message: "Build log updated (offline mode)" }
     }
 
     const response = await fetch(`${API_BASE_URL}/build-logs/${buildId}`, {